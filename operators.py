@@ -4,6 +4,74 @@ from bpy.types import Operator
 from bpy.props import FloatProperty, BoolProperty, EnumProperty
 from mathutils import Vector
 import math
+import numpy as np
+
+# Numba is optional: when available the distance kernel runs as compiled
+# machine code, otherwise the NumPy path below is used
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _min_distances(coords, sel_idx, bnd_idx):
+        num_edges = sel_idx.shape[0]
+        num_bounds = bnd_idx.shape[0]
+
+        # Boundary centers, computed once up front
+        b_centers = np.empty((num_bounds, 3), dtype=np.float64)
+        for b in range(num_bounds):
+            for j in range(3):
+                b_centers[b, j] = (coords[bnd_idx[b, 0], j] + coords[bnd_idx[b, 1], j]) * 0.5
+
+        out = np.empty((num_edges, 2), dtype=np.float64)
+        for e in prange(num_edges):
+            v0 = sel_idx[e, 0]
+            v1 = sel_idx[e, 1]
+            cx = (coords[v0, 0] + coords[v1, 0]) * 0.5
+            cy = (coords[v0, 1] + coords[v1, 1]) * 0.5
+            cz = (coords[v0, 2] + coords[v1, 2]) * 0.5
+            dx = coords[v1, 0] - coords[v0, 0]
+            dy = coords[v1, 1] - coords[v0, 1]
+            dz = coords[v1, 2] - coords[v0, 2]
+            length = np.sqrt(dx * dx + dy * dy + dz * dz)
+            if length > 0.0:
+                dx /= length
+                dy /= length
+                dz /= length
+
+            min_perp2 = np.inf
+            min_surf2 = np.inf
+            for b in range(num_bounds):
+                tx = b_centers[b, 0] - cx
+                ty = b_centers[b, 1] - cy
+                tz = b_centers[b, 2] - cz
+                surf2 = tx * tx + ty * ty + tz * tz
+                along = tx * dx + ty * dy + tz * dz
+                perp2 = surf2 - along * along
+                if perp2 < min_perp2:
+                    min_perp2 = perp2
+                if surf2 < min_surf2:
+                    min_surf2 = surf2
+
+            if min_perp2 < 0.0:
+                min_perp2 = 0.0
+            out[e, 0] = np.sqrt(min_perp2)
+            out[e, 1] = np.sqrt(min_surf2)
+        return out
+
+
+# Analysis results cached across redo-panel re-executes. Cleared on every
+# invoke (vertex positions change between invocations) and on register.
+_analysis_cache = {}
+_ANALYSIS_CACHE_SIZE = 8
+
+# Below this many (edge, boundary) pairs the array/JIT setup cost outweighs
+# the math and plain float arithmetic wins
+_SCALAR_PAIR_LIMIT = 256
+
 
 class MESH_OT_edge_slide_by_distance(Operator):
     """Slide edges by exact distance using Blender's native edge slide"""
@@ -46,7 +114,8 @@ class MESH_OT_edge_slide_by_distance(Operator):
         items=[
             ('PERPENDICULAR', 'Perpendicular', 'Perpendicular distance to boundary'),
             ('ALONG_SURFACE', 'Along Surface', 'Distance along the surface'),
-            ('AVERAGE', 'Average', 'Average of all edge distances')
+            ('AVERAGE', 'Average', 'Average of all edge distances'),
+            ('EXACT', 'Exact (Probe)', 'Measure the real slide range with a tiny probe slide')
         ],
         default='PERPENDICULAR'
     )
@@ -64,11 +133,15 @@ class MESH_OT_edge_slide_by_distance(Operator):
         mesh = obj.data
         bm = bmesh.from_edit_mesh(mesh)
         
-        selected_edges = [e for e in bm.edges if e.select]
-        if not selected_edges:
+        # A fresh invocation means the mesh may have moved; drop stale results
+        _analysis_cache.clear()
+
+        # Stop at the first selected edge instead of materializing the whole
+        # selection; execute builds (and caches) the real list when it runs
+        if not any(e.select for e in bm.edges):
             self.report({'WARNING'}, "Please select an edge loop first")
             return {'CANCELLED'}
-        
+
         # Show dialog
         return context.window_manager.invoke_props_dialog(self, width=350)
     
@@ -108,14 +181,29 @@ class MESH_OT_edge_slide_by_distance(Operator):
         
         # Get BMesh
         bm = bmesh.from_edit_mesh(mesh)
-        selected_edges = [e for e in bm.edges if e.select]
-        
+
+        # Validate the lookup tables exactly once; the analysis below never
+        # adds or removes geometry, so no later index access can hit a
+        # stale-table rebuild
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        # Scan the selection once per instance and keep it by index, so
+        # repeated executes rebuild through the lookup table instead
+        sel_idx = getattr(self, '_sel_idx', None)
+        if sel_idx is None:
+            selected_edges = [e for e in bm.edges if e.select]
+            self._sel_idx = [e.index for e in selected_edges]
+        else:
+            selected_edges = [bm.edges[i] for i in sel_idx]
+
         if not selected_edges:
             self.report({'WARNING'}, "No edges selected")
             return {'CANCELLED'}
         
         # Calculate the slide factor
-        factor = self.calculate_slide_factor(bm, selected_edges, self.distance)
+        factor = self.calculate_slide_factor(mesh, bm, selected_edges, self.distance)
         
         if factor is None:
             self.report({'WARNING'}, "Cannot calculate slide factor")
@@ -141,11 +229,29 @@ class MESH_OT_edge_slide_by_distance(Operator):
         
         return {'FINISHED'}
     
-    def calculate_slide_factor(self, bm, selected_edges, distance):
+    def calculate_slide_factor(self, mesh, bm, selected_edges, distance):
         """Calculate the factor needed for the desired distance"""
-        
-        # Analyze the edge loop structure
-        slide_data = self.analyze_edge_slide(bm, selected_edges)
+
+        if self.measurement_method == 'EXACT':
+            return self.calculate_probe_factor(mesh, bm, selected_edges, distance)
+
+        # The redo panel re-runs execute on every property tweak, but the
+        # analysis only depends on the mesh, the selection, its vertex
+        # positions and the measurement method -- reuse it when nothing
+        # relevant changed. The coordinate fingerprint catches
+        # execute-without-invoke flows (Repeat Last, scripted bpy.ops calls)
+        # where the selection's vertices moved since the cached run.
+        coords_fingerprint = hash(tuple(
+            c for e in selected_edges for v in e.verts for c in v.co))
+        key = (id(mesh), tuple(e.index for e in selected_edges),
+               coords_fingerprint, self.measurement_method)
+        if key in _analysis_cache:
+            slide_data = _analysis_cache[key]
+        else:
+            slide_data = self.analyze_edge_slide(bm, selected_edges)
+            if len(_analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                _analysis_cache.clear()
+            _analysis_cache[key] = slide_data
         
         if not slide_data:
             return None
@@ -173,112 +279,292 @@ class MESH_OT_edge_slide_by_distance(Operator):
             factor = max(-1.0, min(1.0, factor))
         
         return factor
-    
+
+    def calculate_probe_factor(self, mesh, bm, selected_edges, distance):
+        """Measure the slide range with Blender's own transform code
+
+        Runs edge_slide with a tiny probe factor, reads back the vertex
+        displacement it produced, restores the coordinates, and scales the
+        requested distance by the measured distance-per-factor. No custom
+        boundary analysis, exact on any topology.
+        """
+        probe = 1e-4
+
+        # Snapshot the coordinates the probe slide will move
+        sel_verts = {v.index for e in selected_edges for v in e.verts}
+        before = {i: bm.verts[i].co.copy() for i in sel_verts}
+
+        try:
+            bpy.ops.transform.edge_slide(
+                value=probe,
+                use_even=self.use_even,
+                flipped=self.flipped,
+                use_clamp=False,
+                mirror=False,
+                snap=False,
+                release_confirm=True
+            )
+        except Exception:
+            return None
+
+        # The operator invalidated our BMesh wrapper; re-wrap, measure the
+        # displacement and put the coordinates back
+        bm = bmesh.from_edit_mesh(mesh)
+        bm.verts.ensure_lookup_table()
+        total_delta = 0.0
+        for i, co in before.items():
+            total_delta += (bm.verts[i].co - co).length
+            bm.verts[i].co = co
+        bmesh.update_edit_mesh(mesh)
+
+        distance_per_factor = (total_delta / len(before)) / probe
+        if distance_per_factor == 0:
+            return None
+
+        factor = distance / distance_per_factor
+
+        # Clamp if requested
+        if self.use_clamp:
+            factor = max(-1.0, min(1.0, factor))
+
+        return factor
+
     def analyze_edge_slide(self, bm, selected_edges):
         """Analyze the edge slide geometry"""
-        
+
+        # Pull all vertex coordinates into one (N, 3) array up front; every
+        # computation below works on rows of this array instead of going
+        # through per-vertex .co access
+        coords = self.get_vertex_coords(bm)
+
+        # Normalized directions, computed once per unique edge and shared
+        # between the boundary search and the distance kernels
+        dirs = {}
+
+        # Per-face edge-index rows, filled lazily during this run; each
+        # face is shared by two selected edges, so the second visit skips
+        # the face.edges linked-list walk
+        face_edges = {}
+
         # Find boundary edges (what we're sliding between)
-        boundaries = self.find_slide_boundaries(bm, selected_edges)
-        
+        boundaries = self.find_slide_boundaries(bm, selected_edges, coords, dirs, face_edges)
+
         if not boundaries:
             return None
-        
-        # Calculate distances
-        perp_distances = []
-        surface_distances = []
-        
-        for edge in selected_edges:
-            # Skip edges that can't slide
-            if len(edge.link_faces) != 2:
-                continue
-            
-            # Calculate distance for this edge
-            dist_data = self.calculate_edge_distances(edge, boundaries)
-            if dist_data:
-                perp_distances.append(dist_data['perpendicular'])
-                surface_distances.append(dist_data['surface'])
-        
-        if not perp_distances:
+
+        # Skip edges that can't slide
+        slidable = [e for e in selected_edges if len(e.link_faces) == 2]
+        if not slidable:
             return None
-        
-        # Aggregate distances
-        return {
-            'perpendicular_distance': sum(perp_distances) / len(perp_distances),
-            'surface_distance': sum(surface_distances) / len(surface_distances),
-            'average_distance': (sum(perp_distances) + sum(surface_distances)) / (2 * len(perp_distances))
-        }
+
+        sel_idx = np.array([[e.verts[0].index, e.verts[1].index] for e in slidable])
+        bnd_idx = np.array([[e.verts[0].index, e.verts[1].index] for e in boundaries])
+
+        # Only compute the quantities the chosen measurement actually uses
+        method = self.measurement_method
+        need_perp = method in {'PERPENDICULAR', 'AVERAGE'}
+        need_surf = method in {'ALONG_SURFACE', 'AVERAGE'}
+
+        # The boundary search already normalized every slidable edge
+        edge_dirs = np.array([dirs[e.index] for e in slidable], dtype=np.float32)
+
+        perp_distances, surface_distances = self.calculate_edge_distances(
+            coords, sel_idx, bnd_idx, need_perp, need_surf, edge_dirs)
+
+        # Aggregate distances with single C-level reductions
+        slide_data = {}
+        if need_perp:
+            slide_data['perpendicular_distance'] = float(perp_distances.mean())
+        if need_surf:
+            slide_data['surface_distance'] = float(surface_distances.mean())
+        if method == 'AVERAGE':
+            slide_data['average_distance'] = (
+                slide_data['perpendicular_distance'] + slide_data['surface_distance']) / 2
+        return slide_data
     
-    def find_slide_boundaries(self, bm, selected_edges):
-        """Find the boundary edges that we're sliding between"""
-        boundaries = []
-        
-        # Create a set for quick lookup
-        selected_set = set(selected_edges)
-        
+    def get_vertex_coords(self, bm):
+        """Gather all vertex coordinates into one (N, 3) array"""
+        # Gathered from the BMesh, not mesh.vertices.foreach_get, because
+        # the Mesh data is stale while in edit mode
+        return np.array([v.co for v in bm.verts], dtype=np.float32)
+
+    def find_slide_boundaries(self, bm, selected_edges, coords, dirs, face_edges):
+        """Find the boundary edges that we're sliding between
+
+        Relies on the lookup tables validated at the start of execute;
+        no geometry is created or removed here. Normalized directions
+        accumulate in the shared dirs cache for reuse by the caller.
+        """
+        # Track everything by integer edge index; BMEdge objects are only
+        # materialized once at the end
+        seen = set()
+        selected_set = {e.index for e in selected_edges}
+
+        # Local store for faster access in the loops below
+        bm_edges = bm.edges
+
         for edge in selected_edges:
             if len(edge.link_faces) != 2:
                 continue
-            
-            # Check each linked face for parallel edges
+
+            edge_dir = self.get_edge_direction(edge, dirs, coords)
+
             for face in edge.link_faces:
-                for face_edge in face.edges:
-                    if face_edge not in selected_set and face_edge != edge:
-                        # Check if this edge is roughly parallel
-                        if self.are_edges_parallel(edge, face_edge, threshold=0.8):
-                            boundaries.append(face_edge)
-        
-        return list(set(boundaries))  # Remove duplicates
-    
-    def are_edges_parallel(self, edge1, edge2, threshold=0.8):
-        """Check if two edges are roughly parallel"""
-        dir1 = (edge1.verts[1].co - edge1.verts[0].co).normalized()
-        dir2 = (edge2.verts[1].co - edge2.verts[0].co).normalized()
-        
+                row = face_edges.get(face.index)
+                if row is None:
+                    # face.edges is a linked-list walk; record the indices
+                    # so repeat visits within this run skip it
+                    row = tuple(e.index for e in face.edges)
+                    face_edges[face.index] = row
+
+                if len(row) == 4:
+                    # On a quad the boundary is simply the opposite edge,
+                    # no parallelism test needed
+                    opposite = self.find_opposite_edge_in_face(edge, row, bm_edges)
+                    if opposite is not None and opposite.index not in selected_set:
+                        seen.add(opposite.index)
+                    continue
+
+                # Non-quad faces: fall back to the parallelism test
+                for edge_index in row:
+                    if edge_index not in selected_set and edge_index not in seen:
+                        face_edge = bm_edges[edge_index]
+                        face_edge_dir = self.get_edge_direction(face_edge, dirs, coords)
+                        if self.are_edges_parallel(edge_dir, face_edge_dir, threshold=0.8):
+                            seen.add(edge_index)
+
+        return [bm_edges[i] for i in seen]
+
+    def get_edge_direction(self, edge, dirs, coords):
+        """Get the normalized edge direction, cached by edge index"""
+        direction = dirs.get(edge.index)
+        if direction is None:
+            direction = coords[edge.verts[1].index] - coords[edge.verts[0].index]
+            length = math.sqrt(direction.dot(direction))
+            if length > 0:
+                direction = direction / length
+            dirs[edge.index] = direction
+        return direction
+
+    def find_opposite_edge_in_face(self, edge, face_edge_indices, bm_edges):
+        """Find the edge on the opposite side of a quad face"""
+        v0 = edge.verts[0].index
+        v1 = edge.verts[1].index
+        for edge_index in face_edge_indices:
+            face_edge = bm_edges[edge_index]
+            a = face_edge.verts[0].index
+            b = face_edge.verts[1].index
+            # The opposite edge is the only one sharing no vertex with edge
+            if a != v0 and a != v1 and b != v0 and b != v1:
+                return face_edge
+        return None
+
+    def are_edges_parallel(self, dir1, dir2, threshold=0.8):
+        """Check if two normalized directions are roughly parallel"""
         # Check dot product (1 = parallel, -1 = anti-parallel, 0 = perpendicular)
         dot = abs(dir1.dot(dir2))
         return dot > threshold
     
-    def calculate_edge_distances(self, edge, boundaries):
-        """Calculate distances from edge to boundaries"""
-        
-        if not boundaries:
-            return None
-        
-        edge_center = (edge.verts[0].co + edge.verts[1].co) / 2
-        edge_dir = (edge.verts[1].co - edge.verts[0].co).normalized()
-        
-        min_perp_dist = float('inf')
-        min_surface_dist = float('inf')
-        
-        for boundary in boundaries:
-            boundary_center = (boundary.verts[0].co + boundary.verts[1].co) / 2
-            
-            # Vector from edge to boundary
-            to_boundary = boundary_center - edge_center
-            
-            # Perpendicular distance (remove component along edge direction)
-            perp_component = to_boundary - (to_boundary.dot(edge_dir) * edge_dir)
-            perp_dist = perp_component.length
-            
-            # Surface distance (actual distance)
-            surface_dist = to_boundary.length
-            
-            # Keep track of minimum distances
-            if perp_dist < min_perp_dist:
-                min_perp_dist = perp_dist
-            if surface_dist < min_surface_dist:
-                min_surface_dist = surface_dist
-        
-        if min_perp_dist == float('inf'):
-            return None
-        
-        return {
-            'perpendicular': min_perp_dist,
-            'surface': min_surface_dist
-        }
+    def calculate_edge_distances(self, coords, sel_idx, bnd_idx, need_perp=True, need_surf=True, edge_dirs=None):
+        """Calculate per-edge distances to the boundaries in bulk"""
+
+        if sel_idx.shape[0] * bnd_idx.shape[0] <= _SCALAR_PAIR_LIMIT:
+            return self.calculate_edge_distances_scalar(
+                coords, sel_idx, bnd_idx, need_perp, need_surf, edge_dirs)
+
+        if HAS_NUMBA:
+            # The JIT kernel streams over pairs without the E x B
+            # broadcast intermediates of the NumPy path; it normalizes
+            # in-register, so precomputed directions are not needed
+            distances = _min_distances(coords, sel_idx, bnd_idx)
+            return distances[:, 0], distances[:, 1]
+
+        # Edge centers and normalized directions, one row per selected edge
+        edge_centers = coords[sel_idx].mean(axis=1)
+        if edge_dirs is None:
+            edge_dirs = coords[sel_idx[:, 1]] - coords[sel_idx[:, 0]]
+            lengths = np.linalg.norm(edge_dirs, axis=1, keepdims=True)
+            lengths[lengths == 0] = 1.0
+            edge_dirs = edge_dirs / lengths
+
+        boundary_centers = coords[bnd_idx].mean(axis=1)
+
+        # Vectors from every edge center to every boundary center (E x B x 3)
+        to_boundary = boundary_centers[None, :, :] - edge_centers[:, None, :]
+
+        # One fused reduction: perp^2 = |to_boundary|^2 - along^2, so both
+        # distances come from the same squared norms and only the per-edge
+        # minima get a sqrt (2 per edge instead of 2 per pair)
+        surf2 = np.einsum('ebj,ebj->eb', to_boundary, to_boundary)
+
+        perp_distances = None
+        if need_perp:
+            along = np.einsum('ebj,ej->eb', to_boundary, edge_dirs)
+            perp2 = surf2 - along * along
+            perp_distances = np.sqrt(np.maximum(perp2.min(axis=1), 0.0))
+
+        surface_distances = None
+        if need_surf:
+            surface_distances = np.sqrt(surf2.min(axis=1))
+
+        return perp_distances, surface_distances
+
+    def calculate_edge_distances_scalar(self, coords, sel_idx, bnd_idx, need_perp=True, need_surf=True, edge_dirs=None):
+        """Scalar variant of calculate_edge_distances for small selections"""
+        sqrt = math.sqrt
+
+        # Unpack the relevant rows into plain Python floats once; from here
+        # on it's local float arithmetic with no Vector or array temporaries
+        sel_pairs = coords[sel_idx].tolist()
+        bnd_pairs = coords[bnd_idx].tolist()
+        dir_rows = edge_dirs.tolist() if edge_dirs is not None else None
+        bound_centers = [
+            ((x0 + x1) * 0.5, (y0 + y1) * 0.5, (z0 + z1) * 0.5)
+            for (x0, y0, z0), (x1, y1, z1) in bnd_pairs
+        ]
+
+        perp_out = []
+        surf_out = []
+        for n, ((ax, ay, az), (bx, by, bz)) in enumerate(sel_pairs):
+            cx = (ax + bx) * 0.5
+            cy = (ay + by) * 0.5
+            cz = (az + bz) * 0.5
+            if dir_rows is not None:
+                dx, dy, dz = dir_rows[n]
+            else:
+                dx = bx - ax
+                dy = by - ay
+                dz = bz - az
+                length = sqrt(dx * dx + dy * dy + dz * dz)
+                if length > 0.0:
+                    dx /= length
+                    dy /= length
+                    dz /= length
+
+            min_perp2 = float('inf')
+            min_surf2 = float('inf')
+            for ex, ey, ez in bound_centers:
+                tx = ex - cx
+                ty = ey - cy
+                tz = ez - cz
+                surf2 = tx * tx + ty * ty + tz * tz
+                along = tx * dx + ty * dy + tz * dz
+                perp2 = surf2 - along * along
+                if perp2 < min_perp2:
+                    min_perp2 = perp2
+                if surf2 < min_surf2:
+                    min_surf2 = surf2
+
+            perp_out.append(sqrt(max(min_perp2, 0.0)))
+            surf_out.append(sqrt(min_surf2))
+
+        perp_distances = np.array(perp_out) if need_perp else None
+        surface_distances = np.array(surf_out) if need_surf else None
+        return perp_distances, surface_distances
 
 
 def register():
+    _analysis_cache.clear()
     bpy.utils.register_class(MESH_OT_edge_slide_by_distance)
 
 def unregister():
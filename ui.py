@@ -1,6 +1,9 @@
 import bpy
 from bpy.types import Menu, Panel
 
+# Keymap items created in register, so unregister can remove exactly those
+_keymaps = []
+
 def draw_edge_menu(self, context):
     """Add operator to edge menu"""
     self.layout.separator()
@@ -66,18 +69,15 @@ def register():
         km = kc.keymaps.new(name='Mesh', space_type='EMPTY')
         kmi = km.keymap_items.new('mesh.edge_slide_by_distance', 'G', 'PRESS', shift=True, alt=True)
         kmi.active = True
+        _keymaps.append((km, kmi))
 
 def unregister():
     bpy.utils.unregister_class(VIEW3D_PT_edge_slide_distance)
-    
+
     # Remove from edge menu
     bpy.types.VIEW3D_MT_edit_mesh_edges.remove(draw_edge_menu)
-    
-    # Remove keyboard shortcuts
-    wm = bpy.context.window_manager
-    kc = wm.keyconfigs.addon
-    if kc:
-        for km in kc.keymaps:
-            for kmi in km.keymap_items:
-                if kmi.idname == 'mesh.edge_slide_by_distance':
-                    km.keymap_items.remove(kmi)
\ No newline at end of file
+
+    # Remove exactly the keymap items we created, no keymap-wide scan
+    for km, kmi in _keymaps:
+        km.keymap_items.remove(kmi)
+    _keymaps.clear()
\ No newline at end of file